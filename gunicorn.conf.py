@@ -6,7 +6,8 @@ backlog = 2048
 
 # Worker processes
 workers = 4
-worker_class = "sync"
+worker_class = "gthread"
+threads = 4
 worker_connections = 1000
 timeout = 30
 keepalive = 2
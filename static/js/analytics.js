@@ -334,7 +334,7 @@ function calculateCostAnalysisWithAnalytics() {
     if (principal > 0 && interestRate > 0 && term > 0) {
         const monthlyRate = interestRate / 100 / 12;
         const numPayments = term * 12;
-        const monthlyPayment = principal * (monthlyRate * Math.pow(1 + monthlyRate, numPayments)) / (Math.pow(1 + monthlyRate, numPayments) - 1);
+        const monthlyPayment = amortizedPayment(principal, monthlyRate, numPayments);
         const totalPayment = monthlyPayment * numPayments;
         const totalInterest = totalPayment - principal;
         const totalFees = fees + (monthlyFees * numPayments);
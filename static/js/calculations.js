@@ -93,7 +93,7 @@ function calculateCostAnalysis() {
     if (principal > 0 && interestRate > 0 && term > 0) {
         const monthlyRate = interestRate / 100 / 12;
         const numPayments = term * 12;
-        const monthlyPayment = principal * (monthlyRate * Math.pow(1 + monthlyRate, numPayments)) / (Math.pow(1 + monthlyRate, numPayments) - 1);
+        const monthlyPayment = amortizedPayment(principal, monthlyRate, numPayments);
         const totalPayment = monthlyPayment * numPayments;
         const totalInterest = totalPayment - principal;
         const totalFees = fees + (monthlyFees * numPayments);
@@ -145,10 +145,15 @@ function calculateDebtSnowball() {
             let totalInterest = 0;
             let totalPaid = 0;
             let months = 0;
+            const neverPaidOff = [];
             
             debts.forEach(debt => {
                 const monthlyRate = debt.rate / 100 / 12;
-                const numPayments = Math.log(1 + (debt.balance * monthlyRate) / monthlyPayment) / Math.log(1 + monthlyRate);
+                const numPayments = payoffMonths(debt.balance, monthlyRate, monthlyPayment);
+                if (numPayments === Infinity) {
+                    neverPaidOff.push(debt.name);
+                    return;
+                }
                 const interest = (monthlyPayment * numPayments) - debt.balance;
                 totalInterest += interest;
                 totalPaid += debt.balance + interest;
@@ -160,7 +165,8 @@ function calculateDebtSnowball() {
                 totalPaid: totalPaid,
                 totalMonths: months,
                 monthlyPayment: monthlyPayment,
-                debts: debts
+                debts: debts,
+                neverPaidOff: neverPaidOff
             };
             
             // Update results in real-time
@@ -175,6 +181,28 @@ function calculateDebtSnowball() {
     }
 }
 
+// Level monthly payment that amortizes a principal over numPayments periods
+function amortizedPayment(principal, monthlyRate, numPayments) {
+    // Defensive guard: current callers already reject a zero rate
+    if (monthlyRate === 0) {
+        return principal / numPayments;
+    }
+    // (1 + r)^n - 1 via expm1/log1p, which stays accurate for very small rates
+    const growthMinusOne = Math.expm1(numPayments * Math.log1p(monthlyRate));
+    return principal * monthlyRate * (1 + 1 / growthMinusOne);
+}
+
+// Closed-form number of payments to amortize a balance: n = -ln(1 - P*r/M) / ln(1 + r)
+function payoffMonths(balance, monthlyRate, monthlyPayment) {
+    if (monthlyRate === 0) {
+        return balance / monthlyPayment;
+    }
+    if (monthlyPayment <= balance * monthlyRate) {
+        return Infinity; // Payment never covers the interest
+    }
+    return -Math.log1p(-balance * monthlyRate / monthlyPayment) / Math.log1p(monthlyRate);
+}
+
 // Chart creation functions
 function createDebtBrakeCharts(results) {
     // Debt Usage Chart
@@ -595,12 +623,20 @@ function updateDebtSnowballResults(results) {
     const resultsContent = document.getElementById('resultsContent');
     
     if (resultsDiv && resultsContent) {
+        // Totals are undefined when any debt's payment never covers its interest
+        const paysOff = !results.neverPaidOff || results.neverPaidOff.length === 0;
         resultsContent.innerHTML = `
+            ${paysOff ? '' : `
+            <div class="alert alert-warning">
+                <i class="fas fa-exclamation-triangle me-2"></i>
+                Never pays off: the monthly payment does not cover the interest on ${results.neverPaidOff.join(', ')}.
+            </div>
+            `}
             <div class="row g-3">
                 <div class="col-12 col-md-6">
                     <div class="card bg-light">
                         <div class="card-body text-center">
-                            <h5 class="card-title text-danger">${formatCurrency(results.totalInterest)}</h5>
+                            <h5 class="card-title text-danger">${paysOff ? formatCurrency(results.totalInterest) : '&ndash;'}</h5>
                             <p class="card-text">Total Interest</p>
                         </div>
                     </div>
@@ -608,7 +644,7 @@ function updateDebtSnowballResults(results) {
                 <div class="col-12 col-md-6">
                     <div class="card bg-light">
                         <div class="card-body text-center">
-                            <h5 class="card-title text-primary">${formatCurrency(results.totalPaid)}</h5>
+                            <h5 class="card-title text-primary">${paysOff ? formatCurrency(results.totalPaid) : '&ndash;'}</h5>
                             <p class="card-text">Total Paid</p>
                         </div>
                     </div>
@@ -616,7 +652,7 @@ function updateDebtSnowballResults(results) {
                 <div class="col-12 col-md-6">
                     <div class="card bg-light">
                         <div class="card-body text-center">
-                            <h5 class="card-title text-info">${Math.ceil(results.totalMonths)}</h5>
+                            <h5 class="card-title text-info">${paysOff ? Math.ceil(results.totalMonths) : 'Never pays off'}</h5>
                             <p class="card-text">Months to Pay Off</p>
                         </div>
                     </div>
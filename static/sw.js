@@ -1,5 +1,5 @@
 // Service Worker for SME Debt Management Tool
-const CACHE_NAME = 'sme-debt-tool-v1';
+const CACHE_NAME = 'sme-debt-tool-v8';
 const urlsToCache = [
     '/',
     '/static/css/style.css',